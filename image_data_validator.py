@@ -1,9 +1,314 @@
 import os
+import mmap
+import random
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 from PIL import Image
 from PIL.ExifTags import TAGS
 import hashlib
+import numpy as np
+import pandas as pd
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    from turbojpeg import TurboJPEG
+    _turbojpeg = TurboJPEG()
+except (ImportError, OSError):
+    _turbojpeg = None
+
+try:
+    import imagehash
+except ImportError:
+    imagehash = None
+
+
+def _inspect_file(file_path: str):
+    """
+    Reads all image properties needed by the validation checks in one open.
+
+    Parameters:
+    file_path (str): Path to the image file.
+
+    Returns:
+    dict: With keys:
+        - 'format' (str or None): Image format reported by PIL.
+        - 'size' (tuple or None): (width, height) of the image.
+        - 'exif' (dict or None): Raw EXIF data, if present.
+        - 'ok' (bool): True if the file opened and its header parsed cleanly.
+
+    Notes:
+    - Kept at module level so worker processes can run it without pickling
+    validator state.
+    """
+
+    info = {'format': None, 'size': None, 'exif': None, 'ok': False}
+    try:
+        with Image.open(file_path) as img:
+            info['format'] = img.format
+            info['size'] = img.size
+            info['exif'] = img._getexif()
+        info['ok'] = True
+    except (IOError, SyntaxError):
+        pass
+    return info
+
+
+def _jpeg_dims(file_path: str):
+    """
+    Reads the dimensions of a JPEG file straight from its SOF marker.
+
+    Parameters:
+    file_path (str): Path to the JPEG file.
+
+    Returns:
+    tuple: (width, height) of the image, or None if the file is not a
+    readable JPEG or no SOF marker was found.
+
+    Notes:
+    - Walks the marker segments, skipping each by its declared length, until
+    a start-of-frame marker (FFC0-FFCF, excluding DHT/JPG/DAC) is reached.
+    Only a few hundred bytes of the file are read, with no libjpeg involved.
+    """
+
+    try:
+        with open(file_path, "rb") as f:
+            if f.read(2) != b'\xff\xd8':
+                return None
+
+            while True:
+                byte = f.read(1)
+                if not byte:
+                    return None
+                if byte != b'\xff':
+                    continue
+
+                marker = f.read(1)
+                while marker == b'\xff':
+                    marker = f.read(1)
+                if not marker:
+                    return None
+                code = marker[0]
+
+                if 0xC0 <= code <= 0xCF and code not in (0xC4, 0xC8, 0xCC):
+                    # SOF segment: length (2), precision (1), height (2), width (2)
+                    f.seek(3, 1)
+                    payload = f.read(4)
+                    if len(payload) < 4:
+                        return None
+                    height = int.from_bytes(payload[:2], 'big')
+                    width = int.from_bytes(payload[2:], 'big')
+                    return (width, height)
+
+                if code in (0x01, 0xD8) or 0xD0 <= code <= 0xD7:
+                    continue
+                if code in (0xD9, 0xDA):
+                    return None
+
+                length = int.from_bytes(f.read(2), 'big')
+                if length < 2:
+                    return None
+                f.seek(length - 2, 1)
+    except OSError:
+        return None
+
+
+def _has_exif(file_path: str):
+    """
+    Tests whether an image file carries EXIF metadata.
+
+    Parameters:
+    file_path (str): Path to the image file.
+
+    Returns:
+    bool: True if an EXIF segment is present, otherwise False.
+
+    Notes:
+    - For JPEG files this walks the marker segments in the first 64KB looking
+    for an APP1 segment starting with 'Exif\\x00\\x00', which is an order of
+    magnitude cheaper than `Image._getexif()` decoding the TIFF tags.
+    - Non-JPEG files fall back to PIL.
+    """
+
+    try:
+        with open(file_path, "rb") as f:
+            head = f.read(65536)
+    except OSError:
+        return False
+
+    if not head.startswith(b'\xff\xd8'):
+        return _inspect_file(file_path)['exif'] is not None
+
+    pos = 2
+    end = len(head)
+    while pos + 4 <= end:
+        if head[pos] != 0xFF:
+            return False
+        code = head[pos + 1]
+        if code == 0xFF:
+            pos += 1
+            continue
+        if code in (0xD9, 0xDA):
+            return False
+        length = int.from_bytes(head[pos + 2:pos + 4], 'big')
+        if length < 2:
+            return False
+        if code == 0xE1 and head[pos + 4:pos + 10] == b'Exif\x00\x00':
+            return True
+        pos += 2 + length
+    return False
+
+
+def _check_quality(file_path: str, file_size: int = None, strict: bool = False):
+    """
+    Checks if an image file is of good quality by verifying its file size and integrity.
+
+    Parameters:
+    file_path (str): Path to the image file.
+    file_size (int): Size of the file in bytes, if the caller already has it.
+    strict (bool): If True, always verify the full image structure with PIL.
+
+    Returns:
+    bool: True if the file looks intact, otherwise False.
+
+    Notes:
+    - By default this is a fast screen: it checks the JPEG SOI (FFD8) and
+    EOI (FFD9) markers with two small reads. Files that fail the marker
+    screen fall back to a full structural verification.
+    - Full verification prefers libjpeg-turbo (`PyTurboJPEG`), whose SIMD
+    header decode is 2-4x faster than PIL's; PIL handles non-JPEG files and
+    installs without the system library. PyTurboJPEG is an opt-in extra
+    (`poetry install --with turbo`) and also needs libturbojpeg installed
+    on the system; without it the PIL path is used.
+    """
+
+    try:
+        if file_size is None:
+            statfile = os.stat(file_path)
+            file_size = statfile.st_size
+
+        if file_size == 0: return False
+
+        if not strict and file_size >= 4:
+            with open(file_path, "rb") as f:
+                head = f.read(2)
+                f.seek(-2, 2)
+                tail = f.read(2)
+            if head == b'\xff\xd8' and tail == b'\xff\xd9':
+                return True
+
+        if _turbojpeg is not None:
+            with open(file_path, "rb") as f:
+                data = f.read()
+            if data[:2] == b'\xff\xd8':
+                try:
+                    _turbojpeg.decode_header(data)
+                    return True
+                except (IOError, OSError):
+                    return False
+
+        with Image.open(file_path) as img:
+            img.verify()
+
+        return True
+    except (IOError, SyntaxError) as e:
+        return False
+
+
+def _phash_file(file_path: str):
+    """
+    Computes the 64-bit perceptual hash (pHash) of an image.
+
+    Parameters:
+    file_path (str): Path to the image file.
+
+    Returns:
+    int: The pHash as a 64-bit integer, or None if the file is unreadable.
+
+    Notes:
+    - Uses `imagehash.phash` with hash_size=8 (an 8x8 DCT on the downscaled
+    image), so visually similar images map to nearby hashes.
+    - Kept at module level so it can run on the worker pool.
+    """
+
+    try:
+        with Image.open(file_path) as img:
+            return int(str(imagehash.phash(img, hash_size=8)), 16)
+    except (IOError, SyntaxError):
+        return None
+
+
+def _validate_batch(args):
+    """
+    Validates a batch of image files; the unit of work for the pool.
+
+    Parameters:
+    args (tuple): (files, ver_width, ver_height, ext_suffixes) where `files`
+    is a list of (path, filename, class_name, file_size) tuples and
+    `ext_suffixes` is the pre-normalized tuple of accepted file-name
+    suffixes.
+
+    Returns:
+    List[tuple]: One (path, filename, class_name, file_size, inconsistencies,
+    dimension) entry per file, where `inconsistencies` lists
+    (file_path, error, issue) records for the issues found and `dimension`
+    is an (image_name, width, height, class) record created for files
+    without EXIF data (None otherwise).
+
+    Notes:
+    - Must remain a top-level function so `multiprocessing` can pickle it.
+    - JPEG decoding holds the GIL inside one process, so files are validated
+    on a process pool to use all cores.
+    - The expected-size tuple and suffix unpacking are invariant across the
+    scan, so they are bound to locals once per batch rather than once per
+    file, and the invariants are pickled once per batch instead of
+    travelling with every work item.
+    - Well-formed JPEG files are validated entirely from raw marker reads
+    (_jpeg_dims, _check_quality, _has_exif); PIL is only opened as a
+    fallback for everything else.
+    """
+
+    files, ver_width, ver_height, ext_suffixes = args
+    expected_size = (ver_width, ver_height)
+    results = []
+
+    for path, filename, class_name, file_size in files:
+        inconsistencies = []
+        dimension = None
+
+        size = _jpeg_dims(path)
+        if size is None:
+            size = _inspect_file(path)['size']
+
+        if not path.lower().endswith(ext_suffixes):
+            inconsistencies.append((path, 'Invalid extension', 'Extension check failed'))
+
+        if not _check_quality(path, file_size):
+            inconsistencies.append((path, 'Corrupted or empty file', 'Quality check failed'))
+
+        if not _has_exif(path):
+            inconsistencies.append((path, 'No metadata', 'Metadata check failed'))
+            if size is not None:
+                width, height = size
+                dimension = (filename, width, height, os.path.basename(class_name))
+
+        if size != expected_size:
+            inconsistencies.append((path, 'Dimension mismatch', 'Dimension check failed'))
+
+        results.append((path, filename, class_name, file_size, inconsistencies, dimension))
+
+    return results
+
 
 class ImageDataValidator:
     """
@@ -14,6 +319,11 @@ class ImageDataValidator:
     width (int): Expected width of the images.
     height (int): Expected height of the images.
     extensions (List[str]): List of valid image file extensions.
+    audit_rate (float): Fraction of files whose true format is re-checked
+    with PIL (0 disables the audit).
+    phash_threshold (int): Maximum Hamming distance between perceptual
+    hashes for two images to be reported as near-duplicates; None (the
+    default) skips the perceptual pass entirely.
 
     Attributes:
     images_dir (List[str]): List of directory paths to scan for images.
@@ -22,10 +332,16 @@ class ImageDataValidator:
     ver_extensions (List[str]): List of acceptable image file extensions.
     sizes (List[int]): List to store sizes of directories.
     images_hashes (dict): Dictionary mapping image hashes to file names.
-    duplicates (List[dict]): List to store information about duplicate images.
-    inconsistencies (List[dict]): List to record any issues or inconsistencies found.
-    dimensions (List[dict]): List to store metadata about image dimensions.
-    images (dict): Dictionary mapping file paths to file names for all valid images.
+    Only populated by incremental `find_duplicate_images` calls; the scan
+    itself confirms duplicates by byte comparison and leaves it empty.
+    duplicates (pandas.DataFrame): Information about duplicate images.
+    near_duplicates (pandas.DataFrame): Perceptually similar image pairs,
+    when `phash_threshold` is set.
+    inconsistencies (pandas.DataFrame): Any issues or inconsistencies found.
+    dimensions (pandas.DataFrame): Metadata about image dimensions.
+    All three frames are built lazily from columns accumulated during the
+    scan, instead of one dict per record.
+    images (set): Set of file paths for all images found.
 
     Methods:
 
@@ -36,167 +352,465 @@ class ImageDataValidator:
      './name/train/class2']
     
     """
-    def __init__(self, images_dir:List[str], width:int, height:int, extensions:List[str]):
+    def __init__(self, images_dir:List[str], width:int, height:int, extensions:List[str], audit_rate:float=0.01, phash_threshold:int=None):
+        if phash_threshold is not None and imagehash is None:
+            raise ImportError("phash_threshold requires the 'imagehash' package")
+
         self.images_dir = images_dir
         self.ver_width = width
         self.ver_height = height
         self.ver_extensions = extensions
+        self._ext_set = frozenset(ext.lower().lstrip('.') for ext in extensions)
+        self._ext_suffixes = tuple('.' + ext for ext in sorted(self._ext_set))
+        self.audit_rate = audit_rate
+        self.phash_threshold = phash_threshold
         self.sizes = []
         self.images_hashes = {}
-        self.duplicates = []
-        self.inconsistencies = []
-        self.dimensions = []
+        self._duplicates = {'image_name': [], 'class': [], 'duplicate_of': []}
+        self._duplicates_df = None
+        self._near_duplicates = {'image_name': [], 'class': [], 'near_duplicate_of': [], 'distance': []}
+        self._near_duplicates_df = None
+        self._inconsistencies = {'file_path': [], 'error': [], 'issue': []}
+        self._inconsistencies_df = None
+        self._dimensions = {'image_name': [], 'width': [], 'height': [], 'class': []}
+        self._dimensions_df = None
         self.images = self._load_images()
 
+    @property
+    def inconsistencies(self):
+        """
+        Issues found during the scan as a `pandas.DataFrame`.
+
+        Notes:
+        - Built once on first access from the accumulated columns and cached.
+        """
+
+        if self._inconsistencies_df is None:
+            self._inconsistencies_df = pd.DataFrame(self._inconsistencies)
+        return self._inconsistencies_df
+
+    @property
+    def duplicates(self):
+        """
+        Duplicate images found during the scan as a `pandas.DataFrame`.
+
+        Notes:
+        - Built once on first access from the accumulated columns and cached.
+        """
+
+        if self._duplicates_df is None:
+            self._duplicates_df = pd.DataFrame(self._duplicates)
+        return self._duplicates_df
+
+    @property
+    def near_duplicates(self):
+        """
+        Perceptually similar image pairs as a `pandas.DataFrame`.
+
+        Notes:
+        - Only populated when the validator was constructed with a
+        `phash_threshold`; `distance` is the Hamming distance between the
+        two 64-bit perceptual hashes (0 means visually identical).
+        """
+
+        if self._near_duplicates_df is None:
+            self._near_duplicates_df = pd.DataFrame(self._near_duplicates)
+        return self._near_duplicates_df
+
+    def _append_near_duplicate(self, image_name: str, class_name: str, near_duplicate_of: str, distance: int):
+        """
+        Records one near-duplicate pair and invalidates the cached frame.
+        """
+
+        self._near_duplicates['image_name'].append(image_name)
+        self._near_duplicates['class'].append(class_name)
+        self._near_duplicates['near_duplicate_of'].append(near_duplicate_of)
+        self._near_duplicates['distance'].append(distance)
+        self._near_duplicates_df = None
+
+    def _append_inconsistency(self, file_path: str, error: str, issue: str):
+        """
+        Records one inconsistency and invalidates the cached frame.
+        """
+
+        self._inconsistencies['file_path'].append(file_path)
+        self._inconsistencies['error'].append(error)
+        self._inconsistencies['issue'].append(issue)
+        self._inconsistencies_df = None
+
+    def _append_duplicate(self, image_name: str, class_name: str, duplicate_of: str):
+        """
+        Records one duplicate pair and invalidates the cached frame.
+        """
+
+        self._duplicates['image_name'].append(image_name)
+        self._duplicates['class'].append(class_name)
+        self._duplicates['duplicate_of'].append(duplicate_of)
+        self._duplicates_df = None
+
+    @property
+    def dimensions(self):
+        """
+        Metadata about image dimensions as a `pandas.DataFrame`.
+
+        Notes:
+        - Records accumulate in parallel column lists during the scan; the
+        DataFrame is built once on first access and cached, instead of
+        allocating one dict per file.
+        """
+
+        if self._dimensions_df is None:
+            self._dimensions_df = pd.DataFrame(self._dimensions)
+        return self._dimensions_df
+
+    def _append_dimension(self, image_name: str, width: int, height: int, class_name: str):
+        """
+        Records one dimension-metadata entry and invalidates the cached frame.
+        """
+
+        self._dimensions['image_name'].append(image_name)
+        self._dimensions['width'].append(width)
+        self._dimensions['height'].append(height)
+        self._dimensions['class'].append(class_name)
+        self._dimensions_df = None
+
     def _load_images(self):
         """
         Loads images from specified directories, performing checks and recording inconsistencies.
 
         This method iterates through directories listed in `self.images_dir`, verifying each directory
         for file presence. For each image file, it performs various checks (extension, quality, metadata,
-        and dimensions) and records any issues found. It also identifies duplicate images and updates 
-        the internal state with the size of each directory and a mapping of file paths to file names.
+        and dimensions) and records any issues found. It also identifies duplicate images and updates
+        the internal state with the size of each directory and the set of file paths seen.
 
         Returns:
-        dict: A dictionary mapping file paths to file names for all valid images found.
+        set: The file paths of all images found.
 
         Notes:
         - Updates `self.sizes` with a dictionary of directory sizes.
         - Appends inconsistencies to `self.inconsistencies` for files that fail checks.
-        - Uses methods `check_extension`, `check_quality`, `check_metadata`, `check_dimension`,
-        and `find_duplicate_images` for various validations.
+        - Reads each image's format, dimensions, EXIF data and integrity in a
+        single `_inspect` pass, then dispatches the extension, quality,
+        metadata and dimension checks against that result.
+        - Per-file validation runs on a `multiprocessing.Pool`, since JPEG
+        header parsing is CPU-bound and the files are independent.
+        - Duplicate detection runs as a post-pass: size bucketing, then a 4KB
+        prefix-hash partition, then a byte-level comparison of whatever still
+        collides. Unique-sized files never have their content read.
         """
 
-        images = {}
+        images = set()
         sizes_wrapper = {}
-
-        for directory in self.images_dir: 
-            if self.__check_directory_file(directory): 
-                sizes_wrapper[directory] = len(os.listdir(directory))
-
-                for filename in os.listdir(directory):
-                    path = os.path.join(directory, filename)
-                    class_name = directory  
-
-                    if not self.check_extension(path, self.ver_extensions):
-                        self.inconsistencies.append({
-                            'file_path': path,
-                            'error': 'Invalid extension',
-                            'issue': 'Extension check failed'
-                        })
-                        #continue
-
-                    if not self.check_quality(path):
-                        self.inconsistencies.append({
-                            'file_path': path,
-                            'error': 'Corrupted or empty file',
-                            'issue': 'Quality check failed'
-                        })
-                        #continue
-
-                    if not self.check_metadata(path):
-                        self.inconsistencies.append({
-                            'file_path': path,
-                            'error': 'No metadata',
-                            'issue': 'Metadata check failed'
-                        })
-                        self.create_metadata(path)
-                        #continue
-
-                    if not self.check_dimension(path, self.ver_width, self.ver_height):
-                        self.inconsistencies.append({
-                            'file_path': path,
-                            'error': 'Dimension mismatch',
-                            'issue': 'Dimension check failed'
-                        })
-                        #continue
-                        
-                    images[path] = filename
-                    self.find_duplicate_images(path, filename, class_name)
+        pending = []
+        work = []
+
+        for directory in self.images_dir:
+            path = Path(directory)
+            if not path.exists():
+                raise ValueError(f"Directory does not exist: {directory}")
+            if not path.is_dir():
+                raise ValueError(f"Path is not a directory: {directory}")
+
+            with os.scandir(directory) as entries:
+                files = [entry for entry in entries if entry.is_file()]
+
+            if not files:
+                continue
+
+            sizes_wrapper[directory] = len(files)
+            for entry in files:
+                work.append((entry.path, entry.name, directory, entry.stat().st_size))
+
+        if work:
+            batch_size = 64
+            batches = [
+                (work[start:start + batch_size], self.ver_width, self.ver_height, self._ext_suffixes)
+                for start in range(0, len(work), batch_size)
+            ]
+            with multiprocessing.Pool(os.cpu_count()) as pool:
+                for batch in pool.imap(_validate_batch, batches):
+                    for path, filename, class_name, file_size, inconsistencies, dimension in batch:
+                        for record in inconsistencies:
+                            self._append_inconsistency(*record)
+                        if dimension is not None:
+                            self._append_dimension(*dimension)
+
+                        images.add(path)
+                        pending.append((path, filename, class_name, file_size))
+
+        self.__audit_formats(pending)
+
+        duplicate_paths = set()
+        for group in self.__collision_candidates(pending):
+            uniques = []
+            for item in group:
+                original = next((other for other in uniques if self.__files_equal(item[0], other[0])), None)
+                if original is not None:
+                    self._append_duplicate(item[1], item[2], original[1])
+                    duplicate_paths.add(item[0])
+                else:
+                    uniques.append(item)
+
+        if self.phash_threshold is not None:
+            self.__find_near_duplicates(pending, duplicate_paths)
 
         self.sizes = sizes_wrapper
         return images
 
-    def __check_directory_file(self, directory):
+    def __find_near_duplicates(self, pending, duplicate_paths):
         """
-        Checks if a given directory contains any files.
+        Finds perceptually similar images that exact hashing cannot catch.
 
         Parameters:
-        directory (str): Path to the directory to check.
+        pending (List[tuple]): (path, filename, class_name, file_size) tuples
+        collected during the directory walk.
+        duplicate_paths (set): Paths already reported as exact duplicates by
+        the byte-compare pass.
 
         Returns:
-        bool:
-            - True if the directory contains at least one file.
-            - False if the directory is empty or if the path is invalid.
+        None
+
+        Notes:
+        - Exact duplicate detection misses resized or recompressed copies,
+        which drive label noise in training sets. This pass computes a
+        64-bit pHash per image on the worker pool, then compares all pairs
+        with a vectorized Hamming distance (XOR plus a byte popcount table)
+        one row at a time, so no N x N matrix is materialized.
+        - Files already reported as exact duplicates are skipped, matched by
+        full path so a repeated basename in another class directory is not
+        silently dropped from the pass.
+        - Pairs within `phash_threshold` bits are recorded in
+        `self.near_duplicates`.
+        """
+
+        items = [item for item in pending if item[0] not in duplicate_paths]
+        if len(items) < 2:
+            return
+
+        with multiprocessing.Pool(os.cpu_count()) as pool:
+            raw = pool.map(_phash_file, (item[0] for item in items), chunksize=64)
+
+        hashed = [(item, value) for item, value in zip(items, raw) if value is not None]
+        if len(hashed) < 2:
+            return
+
+        hashes = np.fromiter((value for _, value in hashed), dtype=np.uint64, count=len(hashed))
+        popcount = np.unpackbits(np.arange(256, dtype=np.uint8).reshape(-1, 1), axis=1).sum(axis=1)
+
+        for i in range(len(hashed) - 1):
+            xor_bytes = (hashes[i] ^ hashes[i + 1:]).view(np.uint8).reshape(-1, 8)
+            distances = popcount[xor_bytes].sum(axis=1)
+            for j in np.nonzero(distances <= self.phash_threshold)[0]:
+                item = hashed[i + 1 + j][0]
+                self._append_near_duplicate(item[1], item[2], hashed[i][0][1], int(distances[j]))
+
+    def __audit_formats(self, pending):
+        """
+        Re-checks the true image format of a random sample of files with PIL.
 
-        Raises:
-        ValueError:
-            - If the directory does not exist.
-            - If the path is not a directory.
+        Parameters:
+        pending (List[tuple]): (path, filename, class_name, file_size) tuples
+        collected during the directory walk.
+
+        Returns:
+        None
 
         Notes:
-        - Uses the `Path` class from the `pathlib` module to verify directory existence and type.
+        - The hot path trusts the file name suffix (`check_extension`), so a
+        mislabelled file could slip through; auditing `Image.format` on an
+        `audit_rate` sample catches systematic mislabelling without paying a
+        full PIL open per file.
+        - Files whose reported format is not among `ver_extensions` are
+        recorded in `self.inconsistencies`.
         """
-    
-        path = Path(directory)
-        if not path.exists():
-            raise ValueError(f"Directory does not exist: {directory}")
-        if not path.is_dir():
-            raise ValueError(f"Path is not a directory: {directory}")
-        
-        return any(file.is_file() for file in path.iterdir())
 
-    def check_extension(self, file_path: str, type_extension: List[str]):
+        if not self.audit_rate or not pending:
+            return
+
+        sample_size = min(len(pending), max(1, int(len(pending) * self.audit_rate)))
+
+        for path, filename, class_name, _ in random.sample(pending, sample_size):
+            try:
+                with Image.open(path) as img:
+                    image_format = img.format.lower()
+            except IOError:
+                continue
+
+            if image_format not in self._ext_set:
+                self._append_inconsistency(path, f'Actual format is {image_format}', 'Format audit failed')
+
+    def __collision_candidates(self, pending):
         """
-        Checks if an image file has one of the specified file extensions.
+        Narrows the duplicate search down to files that could actually collide.
 
         Parameters:
-        file_path (str): Path to the image file.
-        type_extension (List[str]): List of valid image formats (extensions) to check against.
+        pending (List[tuple]): (path, filename, class_name, file_size) tuples
+        collected during the directory walk.
+
+        Returns:
+        List[list]: Groups of entries from `pending` that still collide and
+        need a byte-level comparison.
+
+        Notes:
+        - Files with a unique size cannot be exact duplicates, so they are
+        discarded without reading any content.
+        - Same-size files are then partitioned by a hash of their first 4KB;
+        only groups still colliding after both steps are compared in full.
+        """
+
+        size_groups = {}
+        for item in pending:
+            size_groups.setdefault(item[3], []).append(item)
+
+        candidates = []
+        for group in size_groups.values():
+            if len(group) < 2:
+                continue
+            prefix_groups = {}
+            for item in group:
+                prefix_groups.setdefault(self.__hash_prefix(item[0]), []).append(item)
+            for prefix_group in prefix_groups.values():
+                if len(prefix_group) > 1:
+                    candidates.append(prefix_group)
+
+        return candidates
+
+    def __files_equal(self, path_a: str, path_b: str):
+        """
+        Compares two files byte-for-byte through memory maps.
+
+        Parameters:
+        path_a (str): Path to the first file.
+        path_b (str): Path to the second file.
 
         Returns:
-        bool: 
-            - True if the image format matches one of the specified extensions.
-            - False if the format does not match or if an error occurs while opening the file.
+        bool: True if both files have identical content, otherwise False.
 
         Notes:
-        - The method checks the image format using the `PIL.Image.format` attribute and compares it against the provided list.
+        - Slices of an `mmap` compare via C memcmp, and the comparison stops
+        at the first differing 64KB window, so mismatched same-size files
+        are rejected after a single read in the common case. Unlike a hash,
+        no file ever has to be read in full unless it really is a duplicate.
         """
 
         try:
-            with Image.open(file_path) as img:
-                return img.format.lower() in (type_extension)
-        except IOError:
+            with open(path_a, "rb") as fa, open(path_b, "rb") as fb:
+                size_a = os.fstat(fa.fileno()).st_size
+                size_b = os.fstat(fb.fileno()).st_size
+                if size_a != size_b:
+                    return False
+                if size_a == 0:
+                    return True
+
+                with mmap.mmap(fa.fileno(), 0, access=mmap.ACCESS_READ) as map_a, \
+                     mmap.mmap(fb.fileno(), 0, access=mmap.ACCESS_READ) as map_b:
+                    window = 65536
+                    for offset in range(0, size_a, window):
+                        if map_a[offset:offset + window] != map_b[offset:offset + window]:
+                            return False
+                    return True
+        except OSError:
             return False
+
+    def __hash_prefix(self, file_path: str, length: int = 4096):
+        """
+        Hashes only the first `length` bytes of a file.
+
+        Parameters:
+        file_path (str): Path to the file.
+        length (int): Number of leading bytes to hash.
+
+        Returns:
+        str: The hexadecimal hash of the prefix, or None if the read failed.
+        """
+
+        try:
+            with open(file_path, "rb") as f:
+                data = f.read(length)
+        except OSError:
+            return None
+
+        if blake3 is not None:
+            return blake3.blake3(data).hexdigest()
+        if xxhash is not None:
+            return xxhash.xxh3_64(data).hexdigest()
+        return hashlib.md5(data).hexdigest()
+
+    def _inspect(self, file_path: str):
+        """
+        Reads all image properties needed by the validation checks in one open.
+
+        Parameters:
+        file_path (str): Path to the image file.
+
+        Returns:
+        dict: With keys:
+            - 'format' (str or None): Image format reported by PIL.
+            - 'size' (tuple or None): (width, height) of the image.
+            - 'exif' (dict or None): Raw EXIF data, if present.
+            - 'ok' (bool): True if the file opened and its header parsed cleanly.
+
+        Notes:
+        - Previously each check opened and parsed the file header on its own;
+        this consolidates them into a single `Image.open` per file.
+        - Deep integrity checking is left to `check_quality`, which screens
+        the JPEG markers cheaply and only falls back to a full verify.
+        """
+
+        return _inspect_file(file_path)
+
+    def check_extension(self, file_path: str, type_extension: List[str] = None):
+        """
+        Checks if an image file has one of the specified file extensions.
+
+        Parameters:
+        file_path (str): Path to the image file.
+        type_extension (List[str]): List of valid extensions to check against;
+        defaults to the extensions the validator was constructed with.
+
+        Returns:
+        bool:
+            - True if the file name ends with one of the specified extensions.
+            - False otherwise.
+
+        Notes:
+        - Compares the file name suffix only; opening the file with PIL just
+        to read `Image.format` cost a full header parse per file.
+        - The constructor's extensions are normalized into a frozenset once,
+        so the per-call membership test is O(1) with no list rebuilt per file.
+        """
+
+        if type_extension is None:
+            ext_set = self._ext_set
+        else:
+            ext_set = frozenset(ext.lower().lstrip('.') for ext in type_extension)
+
+        return file_path.rpartition('.')[2].lower() in ext_set
         
-    def check_quality(self, file_path: str):
+    def check_quality(self, file_path: str, file_size: int = None, strict: bool = False):
         """
         Checks if an image file is of good quality by verifying its file size and integrity.
 
         Parameters:
         file_path (str): Path to the image file.
+        file_size (int): Size of the file in bytes, if the caller already has it;
+        avoids a redundant `os.stat` call.
+        strict (bool): If True, always verify the full image structure with PIL.
 
         Returns:
-        bool: 
+        bool:
             - True if the file size is greater than 0 and the image integrity is verified.
             - False if the file size is 0 or if an error occurs during verification.
 
         Notes:
-        - Uses `os.stat` to check the file size and `PIL.Image.verify` to check image integrity.
+        - By default this is a fast screen: it checks the JPEG SOI (FFD8) and
+        EOI (FFD9) markers with two small reads, avoiding a full structure
+        parse. Files that fail the marker screen (e.g. non-JPEG formats or
+        truncated files) fall back to `PIL.Image.verify` for a definitive
+        answer.
         """
 
-        try:
-            statfile = os.stat(file_path)
-            filesize = statfile.st_size
-        
-            if filesize == 0: return False
-
-            with Image.open(file_path) as img:
-                img.verify() 
-
-            return True
-        except (IOError, SyntaxError) as e:
-            return False
+        return _check_quality(file_path, file_size, strict)
 
     def check_metadata(self, file_path: str):
         """
@@ -206,28 +820,28 @@ class ImageDataValidator:
         file_path (str): Path to the image file.
 
         Returns:
-        Tuple[bool, Optional[dict]]
-            - True and a dictionary of EXIF data if metadata is present.
+        bool:
+            - True if EXIF metadata is present.
             - False if metadata is not present or an error occurs.
 
         Notes:
-        - Returns False if the file cannot be opened or if EXIF data is missing.
+        - Scans the raw APP1 marker for an 'Exif' segment rather than decoding
+        the TIFF tags with `Image._getexif()`; use `_inspect` when the actual
+        EXIF values are needed.
         """
 
-        try:
-            with Image.open(file_path) as img:
-                exif = img._getexif()
-                if exif is None: return False
-                return True, exif
-        except (IOError, SyntaxError) as e:
-            return False
+        return _has_exif(file_path)
         
-    def create_metadata(self, file_path: str):
+    def create_metadata(self, file_path: str, class_name: str = None, size: tuple = None):
         """
         Creates and stores metadata for an image based on its dimensions and class.
 
         Parameters:
         file_path (str): Path to the image file.
+        class_name (str): Class/category of the image; derived from the parent
+        directory when not given.
+        size (tuple): (width, height) of the image, if the caller already has
+        it; avoids re-opening the file.
 
         Returns:
         None
@@ -236,19 +850,21 @@ class ImageDataValidator:
             If an error occurs while opening the file, the exception is returned.
 
         Notes:
-        - Metadata includes the image name, width, height, and the class derived from the file path.
-        - The image class is extracted as the parent directory of the file path.
+        - Metadata includes the image name, width, height, and the class.
+        - The class is resolved with `os.path.basename(os.path.dirname(...))`
+        rather than splitting on '/', which broke on Windows separators and
+        built a throwaway list per file.
         """
-        
+
+        if class_name is None:
+            class_name = os.path.basename(os.path.dirname(file_path))
+
         try:
-            with Image.open(file_path) as img:
-                width, height = img.size
-                self.dimensions.append({
-                    'image_name': os.path.basename(file_path),
-                    'width': width,
-                    'height': height,
-                    'class': file_path.split('/')[-2]
-                })
+            if size is None:
+                with Image.open(file_path) as img:
+                    size = img.size
+            width, height = size
+            self._append_dimension(os.path.basename(file_path), width, height, class_name)
             return None
         except (IOError, SyntaxError) as e:
             return e
@@ -266,9 +882,15 @@ class ImageDataValidator:
         bool: True if the image dimensions match the specified width and height, otherwise False.
 
         Notes:
+        - Reads the dimensions from the JPEG SOF marker directly when possible,
+        falling back to PIL for non-JPEG files.
         - Returns False if the file cannot be opened or the image format is incorrect.
         """
 
+        dims = _jpeg_dims(file_path)
+        if dims is not None:
+            return dims == (width, height)
+
         try:
             with Image.open(file_path) as img:
                 w, h = img.size
@@ -276,34 +898,82 @@ class ImageDataValidator:
         except (IOError, SyntaxError) as e:
             return False
         
-    def __calculate_md5(self, file_path:str):
+    def __calculate_hash(self, file_path:str):
         """
-        Computes the MD5 hash of a file.
+        Computes a content hash of a file for duplicate detection.
 
         Parameters:
-        file_path (str): Path to the file for which the MD5 hash is calculated.
+        file_path (str): Path to the file for which the hash is calculated.
 
         Returns:
-        str: The hexadecimal MD5 hash of the file.
+        str: The hexadecimal hash of the file.
 
         Notes:
-        - The method reads the file in binary mode in chunks of 4096 bytes.
+        - Prefers BLAKE3 (SIMD, multithreaded, memory-mapped) when available,
+        then xxHash (XXH3), and falls back to MD5 from the standard library.
+        - BLAKE3's internal tree hash already spreads one large file across
+        threads; without it, files above 8MB go through `__hash_large_file`,
+        which hashes 1MB segments in parallel.
+        - The streaming paths use `hashlib.file_digest`, which feeds the hash
+        in a single C-level loop (releasing the GIL) instead of a Python
+        `f.read` callback per chunk, so thread pools can genuinely overlap.
+        - Duplicate detection is not adversarial, so a fast non-cryptographic
+        hash is sufficient here.
         """
 
-        hash_md5 = hashlib.md5()
+        if blake3 is not None:
+            hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            hasher.update_mmap(file_path)
+            return hasher.hexdigest()
+
+        if os.stat(file_path).st_size > 8 * 1024 * 1024:
+            return self.__hash_large_file(file_path)
+
+        digest = xxhash.xxh3_64 if xxhash is not None else 'md5'
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
-    
-    def find_duplicate_images(self, file_path: str, file_name: str, class_name: str):
+            return hashlib.file_digest(f, digest).hexdigest()
+
+    def __hash_large_file(self, file_path: str, segment_size: int = 1024 * 1024):
+        """
+        Hashes a large file on multiple threads via a Merkle-Damgard split.
+
+        Parameters:
+        file_path (str): Path to the file to hash.
+        segment_size (int): Size in bytes of each independently hashed segment.
+
+        Returns:
+        str: The hexadecimal hash of the file's segment digests.
+
+        Notes:
+        - Memory-maps the file, hashes each segment with BLAKE2b on a thread
+        pool (the C hash releases the GIL, so the speedup is real), then
+        hashes the concatenation of the segment digests.
+        - The result is only comparable to other hashes produced the same
+        way, which is all duplicate detection needs.
+        """
+
+        with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            offsets = range(0, len(view), segment_size)
+
+            def hash_segment(offset):
+                return hashlib.blake2b(view[offset:offset + segment_size]).digest()
+
+            combined = hashlib.blake2b()
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                for digest in executor.map(hash_segment, offsets):
+                    combined.update(digest)
+
+        return combined.hexdigest()
+
+    def find_duplicate_images(self, file_path: str, file_name: str, class_name: str, image_hash: str = None):
         """
-        Checks for and records duplicate images based on their MD5 hash.
+        Checks for and records duplicate images based on their content hash.
 
         Parameters:
         file_path (str): Path to the image file.
         file_name (str): Name of the image file.
         class_name (str): Class/category of the image.
+        image_hash (str): Precomputed hash of the file, if already available.
 
         Returns:
         None
@@ -311,17 +981,14 @@ class ImageDataValidator:
 
         Notes:
         - `images_hashes` is a dictionary storing image hashes and names.
-        - `duplicates` is a list of dictionaries recording duplicate images.
+        - Duplicate pairs are recorded in the `duplicates` frame.
         """
 
         try:
-            image_hash = self.__calculate_md5(file_path)
+            if image_hash is None:
+                image_hash = self.__calculate_hash(file_path)
             if image_hash in self.images_hashes:
-                self.duplicates.append({
-                    'image_name': file_name,
-                    'class': class_name,
-                    'duplicate_of': self.images_hashes[image_hash]
-                })
+                self._append_duplicate(file_name, class_name, self.images_hashes[image_hash])
             else:
                 self.images_hashes[image_hash] = file_name
         except Exception as e: